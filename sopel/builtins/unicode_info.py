@@ -22,11 +22,9 @@ except ImportError:
 
 def get_codepoint_name(char):
     """Retrieve the code point (and name, if possible) for a given character"""
-    # Get the hex value for the code point, and drop the 0x from the front
-    point = hex(ord(char))[2:]
-
-    # Make the hex 4 characters long with preceding 0s, and all upper case
-    point = point.rjust(4, '0').upper()
+    # Get the upper case hex value for the code point, at least 4 characters
+    # long with preceding 0s
+    point = format(ord(char), '04X')
 
     # get codepoint's name
     name = None
@@ -41,6 +39,7 @@ def get_codepoint_name(char):
 @plugin.command('u')
 @plugin.example('.u ‽', 'U+203D INTERROBANG (‽)', user_help=True)
 @plugin.example('.u 203D', 'U+203D INTERROBANG (‽)', user_help=True)
+@plugin.example('.u 0301', 'U+0301 COMBINING ACUTE ACCENT (\u25cc\u0301)')
 @plugin.output_prefix('[unicode] ')
 def codepoint(bot, trigger):
     """Look up a Unicode character or a hexadecimal code point."""
@@ -64,7 +63,7 @@ def codepoint(bot, trigger):
     if name is None:
         name = '(No name found)'
 
-    template = 'U+%s %s (\xe2\x97\x8c%s)'
+    template = 'U+%s %s (\u25cc%s)'
     if not unicodedata.combining(arg):
         template = 'U+%s %s (%s)'
 
@@ -62,6 +62,19 @@ MODE_PREFIX_PRIVILEGES = {
     "Y": plugin.OPER,
 }
 
+# Symbols of users' privileges, as found in NAMES and WHO replies.
+# This could probably be made flexible in the future (using ISUPPORT's PREFIX),
+# but I don't think it'd be worth it.
+PREFIX_SYMBOL_PRIVILEGES = {
+    "+": plugin.VOICE,
+    "%": plugin.HALFOP,
+    "@": plugin.OP,
+    "&": plugin.ADMIN,
+    "~": plugin.OWNER,
+    "!": plugin.OPER,
+}
+_PREFIX_SYMBOLS = ''.join(PREFIX_SYMBOL_PRIVILEGES)
+
 
 def _handle_account_and_extjoin_capabilities(
     cap_req: tuple[str, ...], bot: SopelWrapper, acknowledged: bool,
@@ -428,6 +441,9 @@ def handle_isupport(bot, trigger):
     uhnames_support = 'UHNAMES' in bot.isupport
     casemapping_support = 'CASEMAPPING' in bot.isupport
     chantypes_support = 'CHANTYPES' in bot.isupport
+    # and the mode parser's sources, to update it only when they change
+    chanmodes = bot.isupport.get('CHANMODES')
+    prefix = bot.isupport.get('PREFIX')
 
     # parse ISUPPORT message from server
     parameters = {}
@@ -442,10 +458,10 @@ def handle_isupport(bot, trigger):
     bot._isupport = bot._isupport.apply(**parameters)
 
     # update bot's mode parser
-    if 'CHANMODES' in bot.isupport:
+    if 'CHANMODES' in bot.isupport and bot.isupport['CHANMODES'] != chanmodes:
         bot.modeparser.chanmodes = bot.isupport.CHANMODES
 
-    if 'PREFIX' in bot.isupport:
+    if 'PREFIX' in bot.isupport and bot.isupport['PREFIX'] != prefix:
         bot.modeparser.privileges = set(bot.isupport.PREFIX.keys())
 
     # rebuild nick when CASEMAPPING and/or CHANTYPES are set
@@ -623,19 +639,6 @@ def handle_names(bot, trigger):
             identifier_factory=bot.make_identifier,
         )
 
-    # This could probably be made flexible in the future, but I don't think
-    # it'd be worth it.
-    # If this ever needs to be updated, remember to change the mode handling in
-    # the WHO-handler functions below, too.
-    mapping = {
-        "+": plugin.VOICE,
-        "%": plugin.HALFOP,
-        "@": plugin.OP,
-        "&": plugin.ADMIN,
-        "~": plugin.OWNER,
-        "!": plugin.OPER,
-    }
-
     uhnames = 'UHNAMES' in bot.isupport
     userhost_in_names = bot.capabilities.is_enabled('userhost-in-names')
 
@@ -656,12 +659,13 @@ def handle_names(bot, trigger):
                     'IRC server/bouncer is not spec compliant.',
                     'UHNAMES' if uhnames else 'userhost-in-names')
 
+        # privileges are only given by the symbols in front of the nick
+        nickname = name.lstrip(_PREFIX_SYMBOLS)
         priv = 0
-        for prefix, value in mapping.items():
-            if prefix in name:
-                priv = priv | value
+        for prefix in name[:len(name) - len(nickname)]:
+            priv = priv | PREFIX_SYMBOL_PRIVILEGES[prefix]
 
-        nick = bot.make_identifier(name.lstrip(''.join(mapping.keys())))
+        nick = bot.make_identifier(nickname)
         user = bot.users.get(nick)
         if user is None:
             # The username/hostname will be included in a NAMES reply only if
@@ -1539,16 +1543,8 @@ def _record_who(
         usr.is_bot = is_bot
     priv = 0
     if modes:
-        mapping = {
-            "+": plugin.VOICE,
-            "%": plugin.HALFOP,
-            "@": plugin.OP,
-            "&": plugin.ADMIN,
-            "~": plugin.OWNER,
-            "!": plugin.OPER,
-        }
         for c in modes:
-            priv = priv | mapping[c]
+            priv = priv | PREFIX_SYMBOL_PRIVILEGES[c]
     if channel not in bot.channels:
         bot.channels[channel] = target.Channel(
             channel,
@@ -181,12 +181,7 @@ class ModeParser:
         type_params: dict[str, ParamRequired] = DEFAULT_MODETYPE_PARAM_CONFIG,
         privileges: set[str] = PRIVILEGES,
     ) -> None:
-        self.chanmodes: dict[str, tuple[str, ...]] = dict(chanmodes)
-        """Map of mode types (``str``) to their lists of modes (``tuple``).
-
-        This map should come from ``ISUPPORT``, usually through
-        :attr:`bot.isupport.CHANMODES <sopel.irc.isupport.ISupport.CHANMODES>`.
-        """
+        self.chanmodes = chanmodes
         self.type_params = dict(type_params)
         """Map of mode types (``str``) with their param requirements.
 
@@ -202,6 +197,32 @@ class ModeParser:
         :attr:`PRIVILEGES` will be used as a default value.
         """
 
+    @property
+    def chanmodes(self) -> dict[str, tuple[str, ...]]:
+        """Map of mode types (``str``) to their lists of modes (``tuple``).
+
+        This map should come from ``ISUPPORT``, usually through
+        :attr:`bot.isupport.CHANMODES <sopel.irc.isupport.ISupport.CHANMODES>`.
+
+        .. note::
+
+            To update the known modes, assign a new map to this attribute;
+            the mode types are looked up from a table built on assignment.
+
+        """
+        return self._chanmodes
+
+    @chanmodes.setter
+    def chanmodes(self, value: dict[str, tuple[str, ...]]) -> None:
+        self._chanmodes = dict(value)
+
+        # if a mode is listed more than once, its first type wins
+        mode_types: dict[str, str] = {}
+        for letter, modes in self._chanmodes.items():
+            for mode in modes:
+                mode_types.setdefault(mode, letter)
+        self._mode_types = mode_types
+
     def get_mode_type(self, mode: str) -> str:
         """Retrieve the type of ``mode``.
 
@@ -220,10 +241,10 @@ class ModeParser:
         including the case where ``mode`` is actually a user privilege such as
         ``v``.
         """
-        for letter, modes in self.chanmodes.items():
-            if mode in modes:
-                return letter
-        raise ModeTypeUnknown(mode)
+        letter = self._mode_types.get(mode)
+        if letter is None:
+            raise ModeTypeUnknown(mode)
+        return letter
 
     def get_mode_info(self, mode: str, is_added: bool) -> tuple[str, bool]:
         """Retrieve ``mode``'s information when added or removed.
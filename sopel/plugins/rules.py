@@ -92,6 +92,9 @@ PRIORITY_SCALES = {
 # Can be implementation-dependent
 _regex_type = type(re.compile(''))
 
+# shared by all rules that don't specify their events
+_DEFAULT_EVENTS: frozenset[str] = frozenset(['PRIVMSG'])
+
 
 def _clean_rules(rules, nick, aliases):
     for pattern in rules:
@@ -191,6 +194,9 @@ class Manager:
         self._action_commands = tools.SopelMemoryWithDefault(dict)
         self._url_callbacks = tools.SopelMemoryWithDefault(list)
         self._register_lock = threading.Lock()
+        # rules sorted by priorities, by event; cleared when the registry
+        # changes
+        self._event_rules: dict[Optional[str], tuple[AbstractRule, ...]] = {}
 
     def unregister_plugin(self, plugin_name):
         """Unregister all the rules from a plugin.
@@ -216,6 +222,7 @@ class Manager:
                 rules_count = len(registry[plugin_name])
                 del registry[plugin_name]
                 unregistered_rules = unregistered_rules + rules_count
+            self._event_rules.clear()
 
         LOGGER.debug(
             '[%s] Successfully unregistered %d rules',
@@ -232,7 +239,8 @@ class Manager:
         """
         with self._register_lock:
             self._rules[rule.get_plugin_name()].append(rule)
-        LOGGER.debug('Rule registered: %s', str(rule))
+            self._event_rules.clear()
+        LOGGER.debug('Rule registered: %s', rule)
 
     def register_command(self, command):
         """Register a plugin command.
@@ -243,7 +251,8 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._commands[plugin][command.name] = command
-        LOGGER.debug('Command registered: %s', str(command))
+            self._event_rules.clear()
+        LOGGER.debug('Command registered: %s', command)
 
     def register_nick_command(self, command):
         """Register a plugin nick command.
@@ -254,7 +263,8 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._nick_commands[plugin][command.name] = command
-        LOGGER.debug('Nick Command registered: %s', str(command))
+            self._event_rules.clear()
+        LOGGER.debug('Nick Command registered: %s', command)
 
     def register_action_command(self, command):
         """Register a plugin action command.
@@ -265,7 +275,8 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._action_commands[plugin][command.name] = command
-        LOGGER.debug('Action Command registered: %s', str(command))
+            self._event_rules.clear()
+        LOGGER.debug('Action Command registered: %s', command)
 
     def register_url_callback(self, url_callback):
         """Register a plugin URL callback.
@@ -276,7 +287,8 @@ class Manager:
         with self._register_lock:
             plugin = url_callback.get_plugin_name()
             self._url_callbacks[plugin].append(url_callback)
-        LOGGER.debug('URL callback registered: %s', str(url_callback))
+            self._event_rules.clear()
+        LOGGER.debug('URL callback registered: %s', url_callback)
 
     def has_rule(self, label, plugin=None):
         """Tell if the manager knows a rule with this ``label``.
@@ -418,38 +430,56 @@ class Manager:
         :return: a tuple of ``(rule, match)``, sorted by priorities
         :rtype: tuple
         """
-        generic_rules = self._rules.values()
-        command_rules = (
-            rules_dict.values()
-            for rules_dict in self._commands.values())
-        nick_rules = (
-            rules_dict.values()
-            for rules_dict in self._nick_commands.values())
-        action_rules = (
-            rules_dict.values()
-            for rules_dict in self._action_commands.values())
-        url_callback_rules = self._url_callbacks.values()
-
-        rules = itertools.chain(
-            itertools.chain(*generic_rules),
-            itertools.chain(*command_rules),
-            itertools.chain(*nick_rules),
-            itertools.chain(*action_rules),
-            itertools.chain(*url_callback_rules),
-        )
-        matches = (
-            (rule, match)
-            for rule in rules
-            for match in rule.match(bot, pretrigger)
-        )
-        # Returning a tuple instead of a sorted object ensures that:
+        # Returning a tuple instead of a generator ensures that:
         #   1. it's not a lazy object
         #   2. it's an immutable iterable
         # We can't accept lazy evaluation or yield results; it has to be a
         # static list of (rule/match), otherwise Python will raise an error
         # if any rule execution tries to alter the list of registered rules.
         # Making it immutable is the cherry on top.
-        return tuple(sorted(matches, key=lambda x: x[0].priority_scale))
+        return tuple(
+            (rule, match)
+            for rule in self._get_event_rules(pretrigger.event)
+            for match in rule.match(bot, pretrigger)
+        )
+
+    def _get_event_rules(self, event):
+        # Only rules that can match the event are kept, so that rules for
+        # other events are skipped without calling their match method.
+        event_rules = self._event_rules.get(event)
+        if event_rules is not None:
+            return event_rules
+
+        with self._register_lock:
+            generic_rules = self._rules.values()
+            command_rules = (
+                rules_dict.values()
+                for rules_dict in self._commands.values())
+            nick_rules = (
+                rules_dict.values()
+                for rules_dict in self._nick_commands.values())
+            action_rules = (
+                rules_dict.values()
+                for rules_dict in self._action_commands.values())
+            url_callback_rules = self._url_callbacks.values()
+
+            rules = itertools.chain(
+                itertools.chain(*generic_rules),
+                itertools.chain(*command_rules),
+                itertools.chain(*nick_rules),
+                itertools.chain(*action_rules),
+                itertools.chain(*url_callback_rules),
+            )
+            # The sort is stable: rules of the same priority keep their
+            # registration order (generic rules first, then commands, nick
+            # commands, action commands, and finally URL callbacks).
+            event_rules = tuple(sorted(
+                (rule for rule in rules if rule.match_event(event)),
+                key=lambda rule: rule.priority_scale,
+            ))
+            self._event_rules[event] = event_rules
+
+        return event_rules
 
     def check_url_callback(self, bot, url):
         """Tell if the ``url`` matches any of the registered URL callbacks.
@@ -1045,7 +1075,8 @@ class Rule(AbstractRule):
         self._handler = handler
 
         # filters
-        self._events: list[str] = events or ['PRIVMSG']
+        self._events: frozenset[str] = (
+            frozenset(events) if events else _DEFAULT_EVENTS)
         self._ctcp = ctcp or []
         self._allow_bots = bool(allow_bots)
         self._allow_echo = bool(allow_echo)
@@ -1171,7 +1202,7 @@ class Rule(AbstractRule):
                 yield result
 
     def match_event(self, event: str | None) -> bool:
-        return bool(event and event in self._events)
+        return event in self._events
 
     def match_ctcp(self, command: str | None) -> bool:
         if not self._ctcp:
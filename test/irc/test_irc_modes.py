@@ -74,6 +74,26 @@ def test_modemessage_get_mode_type_unknown():
         modemessage.get_mode_type('v')
 
 
+def test_modemessage_get_mode_type_chanmodes_updated():
+    modemessage = ModeParser({
+        'A': tuple('bc'),
+        'B': tuple('efg'),
+    }, {})
+
+    modemessage.chanmodes = {
+        'A': tuple('b'),
+        'C': tuple('ez'),
+    }
+
+    assert modemessage.get_mode_type('b') == 'A'
+    assert modemessage.get_mode_type('e') == 'C'
+    assert modemessage.get_mode_type('z') == 'C'
+
+    # mode removed from the new CHANMODES
+    with pytest.raises(ModeTypeUnknown):
+        modemessage.get_mode_type('c')
+
+
 @pytest.mark.parametrize('mode, is_added, result', (
     # X: always
     ('b', ADDED, ('X', REQUIRED)),
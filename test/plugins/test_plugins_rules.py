@@ -32,6 +32,24 @@ def mockbot(tmpconfig, botfactory):
     return botfactory(tmpconfig)
 
 
+@pytest.fixture
+def mocktrigger(mockbot, triggerfactory):
+    wrapper = triggerfactory.wrapper(
+        mockbot, ':Foo!foo@example.com PRIVMSG #channel :test message')
+    return wrapper._trigger
+
+
+@pytest.fixture
+def rule_handler(mockbot):
+    # a cleaned generic rule, which isn't a command of any kind
+    @plugin.rule(r'.*')
+    def handler(wrapped, trigger):
+        wrapped.reply('Hi!')
+
+    loader.clean_callable(handler, mockbot.settings)
+    return handler
+
+
 # -----------------------------------------------------------------------------
 # tests for :class:`Manager`
 
@@ -397,6 +415,45 @@ def test_manager_rule_trigger_on_event(mockbot):
 
     assert rule_events in items[0]
 
+    # going back to the first event gives the same result
+    line = ':Foo!foo@example.com PRIVMSG #sopel :Hello, world'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert len(items) == 2, 'Exactly two rules must match'
+
+
+def test_manager_register_after_get_triggered_rules(mockbot):
+    regex = re.compile('.*')
+    rule_medium = rules.Rule([regex], plugin='testplugin', label='medium')
+    rule_other = rules.Rule([regex], plugin='testplugin', label='other')
+    rule_low = rules.Rule(
+        [regex],
+        plugin='otherplugin',
+        label='low',
+        priority=rules.PRIORITY_LOW)
+    manager = rules.Manager()
+    manager.register(rule_low)
+    manager.register(rule_medium)
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :Hello, world'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert [rule for rule, _ in items] == [rule_medium, rule_low]
+
+    # registering a new rule must be taken into account
+    manager.register(rule_other)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert [rule for rule, _ in items] == [rule_medium, rule_other, rule_low]
+
+    # and so is unregistering a plugin
+    manager.unregister_plugin('otherplugin')
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert [rule for rule, _ in items] == [rule_medium, rule_other]
+
 
 def test_manager_has_command():
     command = rules.Command('hello', prefix=r'\.', plugin='testplugin')
@@ -1550,14 +1607,10 @@ def test_kwargs_from_callable_examples_doc(mockbot):
 # -----------------------------------------------------------------------------
 # tests for rate-limiting features
 
-def test_rule_rate_limit(mockbot, triggerfactory):
+def test_rule_rate_limit(mockbot, mocktrigger):
     def handler(bot, trigger):
         return 'hello'
 
-    wrapper = triggerfactory.wrapper(
-        mockbot, ':Foo!foo@example.com PRIVMSG #channel :test message')
-    mocktrigger = wrapper._trigger
-
     regex = re.compile(r'.*')
     rule = rules.Rule(
         [regex],
@@ -1578,14 +1631,10 @@ def test_rule_rate_limit(mockbot, triggerfactory):
     assert rule.is_global_rate_limited(at_time) is True
 
 
-def test_rule_rate_limit_no_limit(mockbot, triggerfactory):
+def test_rule_rate_limit_no_limit(mockbot, mocktrigger):
     def handler(bot, trigger):
         return 'hello'
 
-    wrapper = triggerfactory.wrapper(
-        mockbot, ':Foo!foo@example.com PRIVMSG #channel :test message')
-    mocktrigger = wrapper._trigger
-
     regex = re.compile(r'.*')
     rule = rules.Rule(
         [regex],
@@ -1606,14 +1655,10 @@ def test_rule_rate_limit_no_limit(mockbot, triggerfactory):
     assert rule.is_global_rate_limited(at_time) is False
 
 
-def test_rule_rate_limit_ignore_rate_limit(mockbot, triggerfactory):
+def test_rule_rate_limit_ignore_rate_limit(mockbot, mocktrigger):
     def handler(bot, trigger):
         return rules.IGNORE_RATE_LIMIT
 
-    wrapper = triggerfactory.wrapper(
-        mockbot, ':Foo!foo@example.com PRIVMSG #channel :test message')
-    mocktrigger = wrapper._trigger
-
     regex = re.compile(r'.*')
     rule = rules.Rule(
         [regex],
@@ -1723,28 +1768,24 @@ def test_rule_rate_limit_messages_default_mixed(mockbot, triggerfactory):
 # tests for :class:`sopel.plugins.rules.Command`
 
 
-def test_command_str():
-    rule = rules.Command('hello', r'\.', plugin='testplugin')
-    assert str(rule) == '<Command testplugin.hello []>'
-
-
-def test_command_str_subcommand():
-    rule = rules.Command('main sub', r'\.', plugin='testplugin')
-    assert str(rule) == '<Command testplugin.main-sub []>'
-
-
-def test_command_str_no_plugin():
-    rule = rules.Command('hello', r'\.')
-    assert str(rule) == '<Command (no-plugin).hello []>'
-
-
-def test_command_str_alias():
-    rule = rules.Command('hello', r'\.', plugin='testplugin', aliases=['hi'])
-    assert str(rule) == '<Command testplugin.hello [hi]>'
-
-    rule = rules.Command(
-        'hello', r'\.', plugin='testplugin', aliases=['hi', 'hey'])
-    assert str(rule) == '<Command testplugin.hello [hi|hey]>'
+@pytest.mark.parametrize(
+    'name, plugin, aliases, expected',
+    [
+        ('hello', 'testplugin', None, '<Command testplugin.hello []>'),
+        ('main sub', 'testplugin', None, '<Command testplugin.main-sub []>'),
+        ('hello', None, None, '<Command (no-plugin).hello []>'),
+        ('hello', 'testplugin', ['hi'], '<Command testplugin.hello [hi]>'),
+        (
+            'hello',
+            'testplugin',
+            ['hi', 'hey'],
+            '<Command testplugin.hello [hi|hey]>',
+        ),
+    ],
+)
+def test_command_str(name, plugin, aliases, expected):
+    rule = rules.Command(name, r'\.', plugin=plugin, aliases=aliases)
+    assert str(rule) == expected
 
 
 def test_command_get_rule_label(mockbot):
@@ -1839,12 +1880,7 @@ def test_command_match(mockbot):
 
     match = matches[0]
     assert match.group(0) == '.hello'
-    assert match.group(1) == 'hello'
-    assert match.group(2) is None
-    assert match.group(3) is None
-    assert match.group(4) is None
-    assert match.group(5) is None
-    assert match.group(6) is None
+    assert match.groups() == ('hello', None, None, None, None, None)
 
 
 def test_command_match_invalid_prefix(mockbot):
@@ -1876,12 +1912,7 @@ def test_command_match_subcommand(mockbot):
 
     match = matches[0]
     assert match.group(0) == '.main sub'
-    assert match.group(1) == 'main sub'
-    assert match.group(2) is None
-    assert match.group(3) is None
-    assert match.group(4) is None
-    assert match.group(5) is None
-    assert match.group(6) is None
+    assert match.groups() == ('main sub', None, None, None, None, None)
 
 
 def test_command_match_subcommand_args(mockbot):
@@ -2141,73 +2172,60 @@ def test_command_from_callable_escaped_regex_pattern(mockbot):
     assert result.group(1) == 'main .*'
 
 
-def test_command_from_callable_invalid(mockbot):
-    # prepare callable
-    @plugin.rule(r'.*')
-    def handler(wrapped, trigger):
-        wrapped.reply('Hi!')
-
-    loader.clean_callable(handler, mockbot.settings)
-
+def test_command_from_callable_invalid(mockbot, rule_handler):
     # create rule from a cleaned callable
     with pytest.raises(RuntimeError):
-        rules.Command.from_callable(mockbot.settings, handler)
+        rules.Command.from_callable(mockbot.settings, rule_handler)
 
 
 # -----------------------------------------------------------------------------
 # tests for :class:`sopel.plugins.rules.NickCommand`
 
 
-def test_nick_command_str():
-    rule = rules.NickCommand('TestBot', 'hello', plugin='testplugin')
-    assert str(rule) == '<NickCommand testplugin.hello [] (TestBot [])>'
-
-
-def test_nick_command_str_no_plugin():
-    rule = rules.NickCommand('TestBot', 'hello')
-    assert str(rule) == '<NickCommand (no-plugin).hello [] (TestBot [])>'
-
-
-def test_nick_command_str_alias():
-    rule = rules.NickCommand(
-        'TestBot', 'hello', plugin='testplugin', aliases=['hi'])
-    assert str(rule) == '<NickCommand testplugin.hello [hi] (TestBot [])>'
-
-    rule = rules.NickCommand(
-        'TestBot', 'hello', plugin='testplugin', aliases=['hi', 'hey'])
-    assert str(rule) == '<NickCommand testplugin.hello [hi|hey] (TestBot [])>'
-
-
-def test_nick_command_str_nick_alias():
-    rule = rules.NickCommand(
-        'TestBot', 'hello', nick_aliases=['Alfred'], plugin='testplugin')
-    assert str(rule) == '<NickCommand testplugin.hello [] (TestBot [Alfred])>'
-
-    rule = rules.NickCommand(
-        'TestBot', 'hello', nick_aliases=['Alfred', 'Joe'], plugin='testplugin')
-    assert str(rule) == (
-        '<NickCommand testplugin.hello [] (TestBot [Alfred|Joe])>'
-    )
-
-
-def test_nick_command_str_alias_and_nick_alias():
-    rule = rules.NickCommand(
-        'TestBot', 'hello',
-        nick_aliases=['Alfred'],
-        aliases=['hi'],
-        plugin='testplugin')
-    assert str(rule) == (
-        '<NickCommand testplugin.hello [hi] (TestBot [Alfred])>'
-    )
-
+@pytest.mark.parametrize(
+    'plugin, aliases, nick_aliases, expected',
+    [
+        (
+            'testplugin', None, None,
+            '<NickCommand testplugin.hello [] (TestBot [])>',
+        ),
+        (
+            None, None, None,
+            '<NickCommand (no-plugin).hello [] (TestBot [])>',
+        ),
+        (
+            'testplugin', ['hi'], None,
+            '<NickCommand testplugin.hello [hi] (TestBot [])>',
+        ),
+        (
+            'testplugin', ['hi', 'hey'], None,
+            '<NickCommand testplugin.hello [hi|hey] (TestBot [])>',
+        ),
+        (
+            'testplugin', None, ['Alfred'],
+            '<NickCommand testplugin.hello [] (TestBot [Alfred])>',
+        ),
+        (
+            'testplugin', None, ['Alfred', 'Joe'],
+            '<NickCommand testplugin.hello [] (TestBot [Alfred|Joe])>',
+        ),
+        (
+            'testplugin', ['hi'], ['Alfred'],
+            '<NickCommand testplugin.hello [hi] (TestBot [Alfred])>',
+        ),
+        (
+            'testplugin', ['hi', 'hey'], ['Alfred', 'Joe'],
+            '<NickCommand testplugin.hello [hi|hey] (TestBot [Alfred|Joe])>',
+        ),
+    ],
+)
+def test_nick_command_str(plugin, aliases, nick_aliases, expected):
     rule = rules.NickCommand(
         'TestBot', 'hello',
-        nick_aliases=['Alfred', 'Joe'],
-        aliases=['hi', 'hey'],
-        plugin='testplugin')
-    assert str(rule) == (
-        '<NickCommand testplugin.hello [hi|hey] (TestBot [Alfred|Joe])>'
-    )
+        nick_aliases=nick_aliases,
+        aliases=aliases,
+        plugin=plugin)
+    assert str(rule) == expected
 
 
 def test_nick_command_get_rule_label(mockbot):
@@ -2268,12 +2286,7 @@ def test_nick_command_match(mockbot):
 
     match = matches[0]
     assert match.group(0) == 'TestBot: hello'
-    assert match.group(1) == 'hello'
-    assert match.group(2) is None
-    assert match.group(3) is None
-    assert match.group(4) is None
-    assert match.group(5) is None
-    assert match.group(6) is None
+    assert match.groups() == ('hello', None, None, None, None, None)
 
 
 def test_nick_command_match_args(mockbot):
@@ -2310,17 +2323,10 @@ def test_nick_command_has_alias(mockbot):
     assert not rule.has_alias('unknown')
 
 
-def test_nick_command_from_callable_invalid(mockbot):
-    # prepare callable
-    @plugin.rule(r'.*')
-    def handler(wrapped, trigger):
-        wrapped.reply('Hi!')
-
-    loader.clean_callable(handler, mockbot.settings)
-
+def test_nick_command_from_callable_invalid(mockbot, rule_handler):
     # create rule from a cleaned callable
     with pytest.raises(RuntimeError):
-        rules.NickCommand.from_callable(mockbot.settings, handler)
+        rules.NickCommand.from_callable(mockbot.settings, rule_handler)
 
 
 def test_nick_command_from_callable(mockbot):
@@ -2437,35 +2443,28 @@ def test_nick_command_from_callable_regex_pattern(mockbot):
     assert len(results) == 1, 'Exactly 1 command must match'
     result = results[0]
     assert result.group(0) == 'TestBot: do .*'
-    assert result.group(1) == 'do .*'
-    assert result.group(2) is None
-    assert result.group(3) is None
-    assert result.group(4) is None
-    assert result.group(5) is None
-    assert result.group(6) is None
+    assert result.groups() == ('do .*', None, None, None, None, None)
 
 
 # -----------------------------------------------------------------------------
 # tests for :class:`sopel.plugins.rules.ActionCommand`
 
-def test_action_command_str():
-    rule = rules.ActionCommand('hello', plugin='testplugin')
-    assert str(rule) == '<ActionCommand testplugin.hello []>'
-
-
-def test_action_command_str_no_plugin():
-    rule = rules.ActionCommand('hello')
-    assert str(rule) == '<ActionCommand (no-plugin).hello []>'
-
-
-def test_action_command_str_alias():
-    rule = rules.ActionCommand(
-        'hello', plugin='testplugin', aliases=['hi'])
-    assert str(rule) == '<ActionCommand testplugin.hello [hi]>'
-
-    rule = rules.ActionCommand(
-        'hello', plugin='testplugin', aliases=['hi', 'hey'])
-    assert str(rule) == '<ActionCommand testplugin.hello [hi|hey]>'
+@pytest.mark.parametrize(
+    'plugin, aliases, expected',
+    [
+        ('testplugin', None, '<ActionCommand testplugin.hello []>'),
+        (None, None, '<ActionCommand (no-plugin).hello []>'),
+        ('testplugin', ['hi'], '<ActionCommand testplugin.hello [hi]>'),
+        (
+            'testplugin',
+            ['hi', 'hey'],
+            '<ActionCommand testplugin.hello [hi|hey]>',
+        ),
+    ],
+)
+def test_action_command_str(plugin, aliases, expected):
+    rule = rules.ActionCommand('hello', plugin=plugin, aliases=aliases)
+    assert str(rule) == expected
 
 
 def test_action_command_get_rule_label(mockbot):
@@ -2483,12 +2482,7 @@ def test_action_command_match(mockbot):
 
     match = matches[0]
     assert match.group(0) == 'hello'
-    assert match.group(1) == 'hello'
-    assert match.group(2) is None
-    assert match.group(3) is None
-    assert match.group(4) is None
-    assert match.group(5) is None
-    assert match.group(6) is None
+    assert match.groups() == ('hello', None, None, None, None, None)
 
 
 def test_action_command_match_args(mockbot):
@@ -2540,17 +2534,10 @@ def test_action_command_match_ctcp(mockbot):
         'ActionCommand never match other CTCP commands')
 
 
-def test_action_command_from_callable_invalid(mockbot):
-    # prepare callable
-    @plugin.rule(r'.*')
-    def handler(wrapped, trigger):
-        wrapped.reply('Hi!')
-
-    loader.clean_callable(handler, mockbot.settings)
-
+def test_action_command_from_callable_invalid(mockbot, rule_handler):
     # create rule from a cleaned callable
     with pytest.raises(RuntimeError):
-        rules.ActionCommand.from_callable(mockbot.settings, handler)
+        rules.ActionCommand.from_callable(mockbot.settings, rule_handler)
 
 
 def test_action_command_from_callable(mockbot):
@@ -2645,12 +2632,7 @@ def test_action_command_from_callable_regex_pattern(mockbot):
     assert len(results) == 1, 'Exactly 1 command must match'
     result = results[0]
     assert result.group(0) == 'do .*'
-    assert result.group(1) == 'do .*'
-    assert result.group(2) is None
-    assert result.group(3) is None
-    assert result.group(4) is None
-    assert result.group(5) is None
-    assert result.group(6) is None
+    assert result.groups() == ('do .*', None, None, None, None, None)
 
 
 # -----------------------------------------------------------------------------
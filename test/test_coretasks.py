@@ -8,6 +8,7 @@ import pytest
 
 from sopel import coretasks
 from sopel.irc import isupport
+from sopel.irc.modes import ModeTypeUnknown
 from sopel.module import ADMIN, HALFOP, OP, OWNER, VOICE
 from sopel.tests import rawlist
 from sopel.tools import Identifier
@@ -320,6 +321,44 @@ def test_handle_isupport(mockbot):
     assert 'CNOTICE' in mockbot.isupport
 
 
+def test_handle_isupport_modeparser(mockbot):
+    mockbot.on_message(
+        ':irc.example.com 005 Sopel '
+        'CHANMODES=eIbq,k,flj,CFLMPQScgimnprstz PREFIX=(ov)@+ '
+        ':are supported by this server')
+
+    chanmodes = mockbot.modeparser.chanmodes
+    privileges = mockbot.modeparser.privileges
+    assert chanmodes == {
+        'A': 'eIbq',
+        'B': 'k',
+        'C': 'flj',
+        'D': 'CFLMPQScgimnprstz',
+    }
+    assert privileges == {'o', 'v'}
+    assert mockbot.modeparser.get_mode_type('q') == 'A'
+
+    # unrelated parameters: the mode parser is left untouched
+    mockbot.on_message(
+        ':irc.example.com 005 Sopel '
+        'CHARSET=ascii NICKLEN=16 '
+        ':are supported by this server')
+
+    assert mockbot.modeparser.chanmodes is chanmodes
+    assert mockbot.modeparser.privileges is privileges
+
+    # new values: the mode parser is updated
+    mockbot.on_message(
+        ':irc.example.com 005 Sopel '
+        'CHANMODES=eIb,k,flj,CFLMPQScgimnprstz PREFIX=(qov)~@+ '
+        ':are supported by this server')
+
+    assert mockbot.modeparser.chanmodes['A'] == 'eIb'
+    assert mockbot.modeparser.privileges == {'q', 'o', 'v'}
+    with pytest.raises(ModeTypeUnknown):
+        mockbot.modeparser.get_mode_type('q')
+
+
 def test_handle_isupport_casemapping(mockbot):
     # Set bot's nick to something that needs casemapping
     mockbot.settings.core.nick = 'Test[a]'
@@ -588,6 +627,21 @@ def test_join_time(mockbot):
     )
 
 
+def test_handle_rpl_namreply_privileges(mockbot):
+    """Make sure privileges are read from the prefixes of each nick in 353"""
+    mockbot.on_message(
+        ':irc.example.com 353 TestBot = #test '
+        ':~Uowner &Uadmin @+Uopvoice %Uhalfop +Uvoice Uplain')
+
+    privileges = mockbot.channels['#test'].privileges
+    assert privileges[Identifier('Uowner')] == OWNER
+    assert privileges[Identifier('Uadmin')] == ADMIN
+    assert privileges[Identifier('Uopvoice')] == OP | VOICE
+    assert privileges[Identifier('Uhalfop')] == HALFOP
+    assert privileges[Identifier('Uvoice')] == VOICE
+    assert privileges[Identifier('Uplain')] == 0
+
+
 def test_handle_rpl_namreply_with_malformed_uhnames(mockbot, caplog):
     """Make sure Sopel can cope with expected but missing hostmask in 353"""
     caplog.set_level(logging.DEBUG)